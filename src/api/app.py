@@ -1,14 +1,19 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import os
 import sys
 from pathlib import Path
+from typing import List, Tuple
 import torch
 
 # Add src to Python path
 src_path = Path(__file__).parent.parent
 sys.path.append(str(src_path.parent))
 
+# The app keeps writing log files; other entry points only log to the console
+os.environ.setdefault("APP_LOG_TO_FILE", "1")
+
 from src.data.data_processor import DataProcessor
 from src.models.summarizer import ReviewSummarizer
 from src.utils.logger import app_logger
@@ -19,22 +24,53 @@ from src.utils.exceptions import ReviewSummarizerException
 import streamlit.runtime.scriptrunner.script_runner
 streamlit.runtime.scriptrunner.script_runner.RerunException = Exception
 
-# Initialize processors outside of Streamlit's caching mechanism
-try:
-    data_processor = DataProcessor()
+@st.cache_resource(show_spinner=False)
+def get_data_processor() -> DataProcessor:
+    """Create the DataProcessor once per process and reuse it across reruns."""
+    processor = DataProcessor()
     app_logger.info("DataProcessor initialized successfully")
-except Exception as e:
-    app_logger.error(f"Error initializing DataProcessor: {str(e)}")
-    data_processor = None
+    return processor
 
-try:
-    summarizer = ReviewSummarizer()
+@st.cache_resource(show_spinner=False)
+def get_summarizer() -> ReviewSummarizer:
+    """Load the summarization model once per process and reuse it across reruns."""
+    model = ReviewSummarizer()
     app_logger.info("ReviewSummarizer initialized successfully")
-except Exception as e:
-    app_logger.error(f"Error initializing ReviewSummarizer: {str(e)}")
-    summarizer = None
+    return model
+
+@st.cache_data(show_spinner=False)
+def load_reviews(file_bytes: bytes, _data_processor: DataProcessor) -> pd.DataFrame:
+    """Load an uploaded reviews CSV, cached on the file contents."""
+    # Save uploaded file temporarily
+    temp_path = os.path.join(config.data_path, "temp_reviews.csv")
+    with open(temp_path, "wb") as f:
+        f.write(file_bytes)
+    
+    return _data_processor.load_data(temp_path)
+
+@st.cache_data(show_spinner=False)
+def prepare_reviews(file_bytes: bytes, _data_processor: DataProcessor) -> Tuple[List[str], np.ndarray]:
+    """Preprocess and score uploaded reviews once per file; slider changes reuse the result."""
+    df = load_reviews(file_bytes, _data_processor)
+    return _data_processor.prepare_for_summarization(df)
+
+def load_components():
+    """Load the cached components, returning None for any that fail to initialize."""
+    try:
+        data_processor = get_data_processor()
+    except Exception as e:
+        app_logger.error(f"Error initializing DataProcessor: {str(e)}")
+        data_processor = None
+
+    try:
+        summarizer = get_summarizer()
+    except Exception as e:
+        app_logger.error(f"Error initializing ReviewSummarizer: {str(e)}")
+        summarizer = None
+
+    return data_processor, summarizer
 
-def check_initialization():
+def check_initialization(data_processor, summarizer):
     """Check if all components are properly initialized."""
     if data_processor is None:
         st.error("Error: Data processor failed to initialize. Please check the logs.")
@@ -61,7 +97,8 @@ def main():
         """)
 
         # Check initialization
-        if not check_initialization():
+        data_processor, summarizer = load_components()
+        if not check_initialization(data_processor, summarizer):
             return
 
         # File upload
@@ -72,13 +109,9 @@ def main():
 
         if uploaded_file:
             try:
-                # Save uploaded file temporarily
-                temp_path = os.path.join(config.data_path, "temp_reviews.csv")
-                with open(temp_path, "wb") as f:
-                    f.write(uploaded_file.getbuffer())
-
                 # Load and process data
-                df = data_processor.load_data(temp_path)
+                file_bytes = uploaded_file.getvalue()
+                df = load_reviews(file_bytes, data_processor)
                 st.success(f"Successfully loaded {len(df)} reviews!")
 
                 # Display sample of reviews
@@ -110,8 +143,8 @@ def main():
 
                 if st.button("Generate Summary"):
                     with st.spinner("Processing reviews..."):
-                        # Prepare reviews
-                        processed_reviews, aspect_scores = data_processor.prepare_for_summarization(df)
+                        # Prepare reviews (cached per uploaded file)
+                        processed_reviews, aspect_scores = prepare_reviews(file_bytes, data_processor)
                         
                         # Filter reviews based on preferences
                         filtered_reviews = data_processor.filter_reviews_by_preference(
@@ -120,32 +153,36 @@ def main():
                             user_preferences
                         )
                         
-                        # Generate base summary
-                        base_summary = summarizer.generate_summary(filtered_reviews)
-                        
-                        # Personalize summary
-                        final_summary = summarizer.personalize_summary(
-                            base_summary,
-                            user_preferences
-                        )
-                        
-                        # Display results
-                        st.subheader("Personalized Summary")
-                        st.write(final_summary)
-                        
-                        # Display aspect coverage
-                        st.subheader("Aspect Coverage in Summary")
-                        coverage = {}
-                        for aspect in config.aspects.aspects:
-                            keywords = config.aspects.aspect_keywords[aspect]
-                            coverage[aspect] = sum(1 for keyword in keywords if keyword in final_summary.lower())
-                        
-                        # Create coverage chart
-                        coverage_df = pd.DataFrame({
-                            'Aspect': list(coverage.keys()),
-                            'Coverage': list(coverage.values())
-                        })
-                        st.bar_chart(coverage_df.set_index('Aspect'))
+                    # Stream base summary as it is generated
+                    st.subheader("Personalized Summary")
+                    placeholder = st.empty()
+                    base_summary = ""
+                    for piece in summarizer.stream_summary(filtered_reviews):
+                        base_summary += piece
+                        placeholder.write(base_summary)
+                    
+                    # Personalize summary
+                    final_summary = summarizer.personalize_summary(
+                        base_summary,
+                        user_preferences
+                    )
+                    
+                    # Display results
+                    placeholder.write(final_summary)
+                    
+                    # Display aspect coverage
+                    st.subheader("Aspect Coverage in Summary")
+                    coverage = {}
+                    for aspect in config.aspects.aspects:
+                        keywords = config.aspects.aspect_keywords[aspect]
+                        coverage[aspect] = sum(1 for keyword in keywords if keyword in final_summary.lower())
+                    
+                    # Create coverage chart
+                    coverage_df = pd.DataFrame({
+                        'Aspect': list(coverage.keys()),
+                        'Coverage': list(coverage.values())
+                    })
+                    st.bar_chart(coverage_df.set_index('Aspect'))
 
             except Exception as e:
                 st.error(f"Error processing reviews: {str(e)}")
@@ -6,10 +6,17 @@ from typing import List, Dict
 class ModelConfig:
     model_name: str = "t5-small"  # Using t5-small for M1 Mac optimization
     max_length: int = 512
-    min_length: int = 50
-    num_beams: int = 4
+    min_length: int = 0  # Per-chunk summaries are often shorter than a fixed floor
+    num_beams: int = 1  # Greedy decoding; raise to 2-4 for beam search
+    do_sample: bool = False
+    use_cache: bool = True  # Reuse past key/values while decoding
+    no_repeat_ngram_size: int = 3
+    length_penalty: float = 1.0
     device: str = "mps"  # Metal Performance Shaders for M1 Mac
     batch_size: int = 8
+    quantize: str = "int8"  # "int8" for 8-bit weights (fp16 on MPS), "none" for full precision
+    half_precision: bool = True  # float16 autocast on CUDA, float16 weights on MPS
+    compile_model: bool = True  # torch.compile the forward pass on CUDA
 
 @dataclass
 class AspectConfig:
@@ -1,43 +1,34 @@
 import pandas as pd
 import numpy as np
-from typing import List, Dict, Optional, Tuple
+import re
+from collections import Counter
+from typing import List, Dict, Optional, Tuple, Union
 from ..utils.logger import app_logger
 from ..utils.exceptions import DataProcessingError
 from ..config.config import config
-import nltk
-from nltk.tokenize import sent_tokenize, word_tokenize
-from nltk.corpus import stopwords
+from .stopwords import STOPWORDS
 import os
-import ssl
+
+# Words (keeping hyphenated keywords such as "user-friendly" intact) and
+# single punctuation marks. Punctuation is tokenized like NLTK's word_tokenize
+# did, so it still counts towards the length used to normalize aspect scores.
+_WORD_RE = re.compile(r"\w+(?:-\w+)*|[^\w\s]")
 
 class DataProcessor:
     def __init__(self):
-        """Initialize the DataProcessor with necessary NLTK downloads."""
+        """Initialize the DataProcessor with stopwords and aspect keyword lookups."""
         try:
-            # Create NLTK data directory if it doesn't exist
-            nltk_data_dir = os.path.expanduser('~/nltk_data')
-            if not os.path.exists(nltk_data_dir):
-                os.makedirs(nltk_data_dir)
-            
-            # Handle SSL certificate issues for NLTK downloads
-            try:
-                _create_unverified_https_context = ssl._create_unverified_context
-            except AttributeError:
-                pass
-            else:
-                ssl._create_default_https_context = _create_unverified_https_context
+            # Initialize stopwords
+            self.stop_words = STOPWORDS
 
-            # Download required NLTK data with error handling
-            for resource in ['punkt', 'stopwords']:
-                try:
-                    nltk.data.find(f'tokenizers/{resource}')
-                except LookupError:
-                    app_logger.info(f"Downloading NLTK resource: {resource}")
-                    nltk.download(resource, quiet=True)
+            # Map each keyword to the aspects it counts towards
+            self._aspects = list(config.aspects.aspect_keywords)
+            self._kw_to_aspects: Dict[str, List[str]] = {}
+            for aspect, keywords in config.aspects.aspect_keywords.items():
+                for keyword in keywords:
+                    self._kw_to_aspects.setdefault(keyword, []).append(aspect)
 
-            # Initialize stopwords
-            self.stop_words = set(stopwords.words('english'))
-            app_logger.info("DataProcessor initialized successfully with NLTK resources")
+            app_logger.info("DataProcessor initialized successfully")
             
         except Exception as e:
             app_logger.error(f"Error initializing DataProcessor: {str(e)}")
@@ -86,16 +77,8 @@ class DataProcessor:
             str: Preprocessed text
         """
         try:
-            # Convert to lowercase
-            text = text.lower()
-            
-            # Basic cleaning
-            text = text.replace('\n', ' ').replace('\r', ' ')
-            
-            # Remove extra whitespace
-            text = ' '.join(text.split())
-            
-            return text
+            # Lowercase, then collapse all whitespace (including newlines) to single spaces
+            return ' '.join(text.lower().split())
             
         except Exception as e:
             app_logger.error(f"Error preprocessing text: {str(e)}")
@@ -112,30 +95,72 @@ class DataProcessor:
             Dict[str, float]: Dictionary of aspect scores
         """
         try:
-            text = self.preprocess_text(text)
-            
-            try:
-                words = word_tokenize(text)
-            except LookupError:
-                # Fallback to basic tokenization if NLTK fails
-                words = text.split()
-            
-            words = [w for w in words if w not in self.stop_words]
-            
-            scores = {}
-            for aspect, keywords in config.aspects.aspect_keywords.items():
-                # Count occurrences of aspect keywords
-                keyword_count = sum(1 for word in words if word in keywords)
-                # Normalize score between 0 and 1
-                scores[aspect] = min(1.0, keyword_count / len(words) * 5)
-            
-            return scores
+            return self._scores_from_tokens(self._tokens_from_text(self.preprocess_text(text)))
             
         except Exception as e:
             app_logger.error(f"Error calculating aspect scores: {str(e)}")
             raise DataProcessingError("Failed to calculate aspect scores", error=e)
 
-    def prepare_for_summarization(self, reviews: pd.DataFrame) -> Tuple[List[str], List[Dict[str, float]]]:
+    def _tokens_from_text(self, text: str) -> List[str]:
+        """
+        Tokenize preprocessed text into words and punctuation, dropping stopwords.
+        
+        Args:
+            text (str): Output of preprocess_text
+            
+        Returns:
+            List[str]: Non-stopword tokens, including punctuation
+        """
+        return [w for w in _WORD_RE.findall(text) if w not in self.stop_words]
+
+    def _scores_from_tokens(self, tokens: List[str]) -> Dict[str, float]:
+        """
+        Calculate aspect scores from tokenized review text.
+        
+        Args:
+            tokens (List[str]): Output of _tokens_from_text
+            
+        Returns:
+            Dict[str, float]: Dictionary of aspect scores
+        """
+        counts = Counter(tokens)
+        total_words = len(tokens)
+        
+        # Accumulate keyword counts per aspect in a single pass
+        keyword_counts = dict.fromkeys(self._aspects, 0)
+        for word in counts.keys() & self._kw_to_aspects.keys():
+            for aspect in self._kw_to_aspects[word]:
+                keyword_counts[aspect] += counts[word]
+        
+        # Normalize scores between 0 and 1
+        return {
+            aspect: min(1.0, count / total_words * 5) if total_words else 0.0
+            for aspect, count in keyword_counts.items()
+        }
+
+    def _as_score_matrix(
+        self,
+        aspect_scores: Union[np.ndarray, List[Dict[str, float]]]
+    ) -> np.ndarray:
+        """
+        Convert per-review aspect scores into a dense matrix.
+        
+        Args:
+            aspect_scores (Union[np.ndarray, List[Dict[str, float]]]): Score matrix or list of score dicts
+            
+        Returns:
+            np.ndarray: Matrix of shape (n_reviews, n_aspects) in config.aspects.aspects order
+        """
+        if isinstance(aspect_scores, np.ndarray):
+            return aspect_scores
+        
+        aspects = config.aspects.aspects
+        return np.array(
+            [[scores.get(aspect, 0.0) for aspect in aspects] for scores in aspect_scores],
+            dtype=np.float32
+        ).reshape(-1, len(aspects))
+
+    def prepare_for_summarization(self, reviews: pd.DataFrame) -> Tuple[List[str], np.ndarray]:
         """
         Prepare reviews for summarization.
         
@@ -143,21 +168,26 @@ class DataProcessor:
             reviews (pd.DataFrame): DataFrame containing reviews
             
         Returns:
-            Tuple[List[str], List[Dict[str, float]]]: Preprocessed reviews and their aspect scores
+            Tuple[List[str], np.ndarray]: Deduplicated preprocessed reviews and their aspect score matrix
+                of shape (n_reviews, n_aspects), columns ordered as config.aspects.aspects
         """
         try:
-            processed_reviews = []
-            aspect_scores_list = []
+            texts = reviews['review_text'].astype(str).to_numpy()
+            processed_reviews = [self.preprocess_text(text) for text in texts]
             
-            for _, row in reviews.iterrows():
-                processed_text = self.preprocess_text(row['review_text'])
-                aspect_scores = self.calculate_aspect_scores(processed_text)
-                
-                processed_reviews.append(processed_text)
-                aspect_scores_list.append(aspect_scores)
+            # Drop duplicate reviews, keeping first occurrences in order
+            unique_reviews = list(dict.fromkeys(processed_reviews))
+            num_duplicates = len(processed_reviews) - len(unique_reviews)
+            if num_duplicates:
+                app_logger.info(f"Removed {num_duplicates} duplicate reviews")
+            processed_reviews = unique_reviews
+            
+            aspect_scores = self._as_score_matrix(
+                [self._scores_from_tokens(self._tokens_from_text(text)) for text in processed_reviews]
+            )
             
             app_logger.info(f"Successfully prepared {len(processed_reviews)} reviews for summarization")
-            return processed_reviews, aspect_scores_list
+            return processed_reviews, aspect_scores
             
         except Exception as e:
             app_logger.error(f"Error preparing reviews for summarization: {str(e)}")
@@ -166,7 +196,7 @@ class DataProcessor:
     def filter_reviews_by_preference(
         self,
         reviews: List[str],
-        aspect_scores: List[Dict[str, float]],
+        aspect_scores: Union[np.ndarray, List[Dict[str, float]]],
         user_preferences: Dict[str, float]
     ) -> List[str]:
         """
@@ -174,25 +204,28 @@ class DataProcessor:
         
         Args:
             reviews (List[str]): List of preprocessed reviews
-            aspect_scores (List[Dict[str, float]]): List of aspect scores for each review
+            aspect_scores (Union[np.ndarray, List[Dict[str, float]]]): Aspect score matrix
+                from prepare_for_summarization, or a list of aspect score dicts
             user_preferences (Dict[str, float]): User's aspect preferences
             
         Returns:
             List[str]: Filtered and prioritized reviews
         """
         try:
-            # Calculate relevance score for each review
-            relevance_scores = []
-            for review_scores in aspect_scores:
-                score = sum(
-                    review_scores[aspect] * pref_score
-                    for aspect, pref_score in user_preferences.items()
-                )
-                relevance_scores.append(score)
-            
-            # Sort reviews by relevance
-            sorted_indices = np.argsort(relevance_scores)[::-1]
-            filtered_reviews = [reviews[i] for i in sorted_indices[:config.data.max_reviews]]
+            # Calculate relevance score for each review in a single matrix product
+            score_matrix = self._as_score_matrix(aspect_scores)
+            prefs = np.array(
+                [user_preferences.get(aspect, 0.0) for aspect in config.aspects.aspects],
+                dtype=np.float32
+            )
+            relevance_scores = score_matrix @ prefs
+            
+            # Select the top-k reviews, then sort only those by relevance.
+            # Equal scores keep the original argsort()[::-1] order: later reviews first.
+            k = min(config.data.max_reviews, len(relevance_scores))
+            top_indices = np.sort(np.argpartition(relevance_scores, -k)[-k:]) if k else np.array([], dtype=int)
+            top_indices = top_indices[np.argsort(relevance_scores[top_indices], kind="stable")[::-1]]
+            filtered_reviews = [reviews[i] for i in top_indices]
             
             app_logger.info(f"Successfully filtered reviews based on user preferences")
             return filtered_reviews
@@ -1,10 +1,32 @@
+import asyncio
+import contextlib
+import re
+import threading
+import numpy as np
 import torch
-from transformers import T5ForConditionalGeneration, T5Tokenizer
-from typing import List, Optional
+from transformers import (
+    StoppingCriteria,
+    StoppingCriteriaList,
+    T5ForConditionalGeneration,
+    T5Tokenizer,
+    TextIteratorStreamer
+)
+from typing import Iterator, List, Optional, Tuple
 from ..utils.logger import app_logger
 from ..utils.exceptions import ModelError
 from ..config.config import config
 
+# Sentence boundaries: whitespace following terminal punctuation
+_SENTENCE_RE = re.compile(r"(?<=[.!?])\s+")
+
+class _StopOnEvent(StoppingCriteria):
+    """Stops generation once an event is set, e.g. when a streaming consumer goes away."""
+    def __init__(self, event: threading.Event):
+        self.event = event
+
+    def __call__(self, input_ids: torch.LongTensor, scores: torch.FloatTensor, **kwargs) -> torch.BoolTensor:
+        return torch.full((input_ids.shape[0],), self.event.is_set(), dtype=torch.bool, device=input_ids.device)
+
 class ReviewSummarizer:
     def __init__(self):
         """Initialize the T5 model and tokenizer."""
@@ -24,17 +46,107 @@ class ReviewSummarizer:
             try:
                 self.model_name = config.model.model_name
                 self.tokenizer = T5Tokenizer.from_pretrained(self.model_name)
-                self.model = T5ForConditionalGeneration.from_pretrained(self.model_name)
-                self.model.to(self.device)
+                self.model = self._load_model()
+                self._pad_multiple = self._compile_model()
                 app_logger.info(f"Successfully loaded {self.model_name} model")
             except Exception as model_error:
                 app_logger.error(f"Error loading model or tokenizer: {str(model_error)}")
                 raise ModelError("Failed to load model or tokenizer", error=model_error)
+
+            # Number of inputs that skipped chunking because they fit in one chunk
+            self._fast_path_hits = 0
+
+            # Precompile one keyword alternation per aspect for sentence scoring
+            self._aspect_patterns = {
+                aspect: re.compile(r"\b(?:" + "|".join(map(re.escape, keywords)) + r")\b")
+                for aspect, keywords in config.aspects.aspect_keywords.items()
+            }
             
         except Exception as e:
             app_logger.error(f"Error initializing model: {str(e)}")
             raise ModelError("Failed to initialize model", error=e)
 
+    def _load_model(self) -> T5ForConditionalGeneration:
+        """
+        Load the T5 model onto the selected device, quantizing it if configured.
+        
+        Returns:
+            T5ForConditionalGeneration: Loaded model
+        """
+        quantize = config.model.quantize
+        
+        if quantize == "int8" and self.device.type == "cuda":
+            try:
+                import bitsandbytes  # noqa: F401
+                from transformers import BitsAndBytesConfig
+            except ImportError:
+                app_logger.warning("bitsandbytes not installed, loading model without int8 quantization")
+            else:
+                app_logger.info("Loading model with bitsandbytes int8 weights")
+                return T5ForConditionalGeneration.from_pretrained(
+                    self.model_name,
+                    quantization_config=BitsAndBytesConfig(load_in_8bit=True),
+                    device_map="auto"
+                )
+        
+        model = T5ForConditionalGeneration.from_pretrained(self.model_name)
+        model.to(self.device)
+        
+        if quantize == "int8" and self.device.type == "cpu":
+            app_logger.info("Applying dynamic int8 quantization to linear layers")
+            model = torch.ao.quantization.quantize_dynamic(
+                model, {torch.nn.Linear}, dtype=torch.qint8
+            )
+        elif self.device.type == "mps" and (quantize == "int8" or config.model.half_precision):
+            # MPS has no int8 kernels and autocast support is limited, so cast
+            # the weights to half precision once instead
+            app_logger.info("Casting model to float16 for MPS")
+            model = model.half()
+        
+        return model
+
+    def _compile_model(self) -> Optional[int]:
+        """
+        Compile the model forward pass with torch.compile on CUDA.
+        
+        Generation with a compiled model uses a static KV cache so decoder shapes
+        stay fixed across decode steps. The default compile mode is used rather than
+        "reduce-overhead": its CUDA graphs are recorded per thread, and generation
+        runs in worker threads for streaming and agenerate_summary.
+        
+        Returns:
+            Optional[int]: Multiple to pad input lengths to so compiled graphs are
+                reused across batches, or None when the model is not compiled
+        """
+        if self.device.type != "cuda" or not config.model.compile_model:
+            return None
+        if getattr(self.model, "is_loaded_in_8bit", False):
+            app_logger.info("Skipping torch.compile for int8 model")
+            return None
+        # Older transformers releases can't give T5 a static cache; the flag was
+        # _supports_static_cache before being folded into _can_compile_fullgraph
+        if not (
+            getattr(self.model, "_supports_static_cache", False)
+            or getattr(self.model, "_can_compile_fullgraph", False)
+        ):
+            app_logger.info("Skipping torch.compile, model does not support a static cache")
+            return None
+        
+        self.model.forward = torch.compile(self.model.forward)
+        app_logger.info("Compiled model forward pass with torch.compile")
+        return 64
+
+    def _autocast(self):
+        """
+        Return the mixed-precision context for generation on the current device.
+        
+        Returns:
+            ContextManager: float16 autocast on CUDA, otherwise a no-op context
+        """
+        if self.device.type == "cuda" and config.model.half_precision:
+            return torch.autocast(device_type="cuda", dtype=torch.float16)
+        return contextlib.nullcontext()
+
     def _prepare_input_text(self, reviews: List[str]) -> str:
         """
         Prepare reviews for input to T5 model.
@@ -57,44 +169,175 @@ class ReviewSummarizer:
             app_logger.error(f"Error preparing input text: {str(e)}")
             raise ModelError("Failed to prepare input text", error=e)
 
-    def _chunk_text(self, text: str, max_length: int) -> List[str]:
+    def _chunk_text(self, text: str, max_length: int) -> List[List[int]]:
         """
-        Split text into chunks that fit within model's max length.
+        Split text into token ID chunks that fit within model's max length.
         
         Args:
             text (str): Input text to chunk
             max_length (int): Maximum token length
             
         Returns:
-            List[str]: List of text chunks
+            List[List[int]]: List of token ID chunks, each terminated by EOS
         """
         try:
-            # Tokenize text
-            tokens = self.tokenizer.encode(text)
-            chunks = []
+            # Tokenize text once and slice the IDs directly, reserving one
+            # position per chunk for the EOS token
+            tokens = self.tokenizer.encode(text, add_special_tokens=False)
+            eos_token_id = self.tokenizer.eos_token_id
             
-            # Split into chunks
-            current_chunk = []
-            current_length = 0
+            # Fast path: most uploads fit in a single chunk
+            if len(tokens) < max_length:
+                self._fast_path_hits += 1
+                app_logger.debug(f"Single-chunk fast path taken ({self._fast_path_hits} total)")
+                return [tokens + [eos_token_id]]
             
-            for token in tokens:
-                if current_length + 1 > max_length:
-                    chunks.append(self.tokenizer.decode(current_chunk))
-                    current_chunk = []
-                    current_length = 0
-                
-                current_chunk.append(token)
-                current_length += 1
-            
-            if current_chunk:
-                chunks.append(self.tokenizer.decode(current_chunk))
-            
-            return chunks
+            step = max_length - 1
+            return [
+                tokens[i:i + step] + [eos_token_id]
+                for i in range(0, len(tokens), step)
+            ]
             
         except Exception as e:
             app_logger.error(f"Error chunking text: {str(e)}")
             raise ModelError("Failed to chunk text", error=e)
 
+    def _batch_chunks(self, reviews: List[str]) -> Tuple[List[List[List[int]]], List[int]]:
+        """
+        Tokenize reviews and group chunks of similar length into mini-batches.
+        
+        Args:
+            reviews (List[str]): List of preprocessed reviews
+            
+        Returns:
+            Tuple[List[List[List[int]]], List[int]]: Mini-batches of token ID chunks
+                and the original chunk index of each chunk, in batch order
+        """
+        input_text = self._prepare_input_text(reviews)
+        chunks = self._chunk_text(input_text, config.model.max_length)
+        batch_size = config.model.batch_size
+        
+        # Sorting by length keeps padding within each mini-batch small
+        order = sorted(range(len(chunks)), key=lambda i: len(chunks[i]))
+        sorted_chunks = [chunks[i] for i in order]
+        
+        # Mini-batches bound device memory
+        batches = [sorted_chunks[i:i + batch_size] for i in range(0, len(sorted_chunks), batch_size)]
+        return batches, order
+
+    @staticmethod
+    def _restore_order(summaries: List[str], order: List[int]) -> List[str]:
+        """
+        Put chunk summaries produced in batch order back into chunk order.
+        
+        Args:
+            summaries (List[str]): Summaries in batch order
+            order (List[int]): Original chunk index for each position
+            
+        Returns:
+            List[str]: Summaries in original chunk order
+        """
+        restored = [""] * len(order)
+        for summary, index in zip(summaries, order):
+            restored[index] = summary
+        return restored
+
+    def _generate_batch(
+        self,
+        batch: List[List[int]],
+        streamer: Optional[TextIteratorStreamer] = None,
+        stopping_criteria: Optional[StoppingCriteriaList] = None
+    ) -> List[str]:
+        """
+        Generate summaries for one mini-batch of token ID chunks.
+        
+        Args:
+            batch (List[List[int]]): Token ID chunks
+            streamer (Optional[TextIteratorStreamer]): Receives decoded text as it is
+                generated; requires a batch of one chunk and greedy decoding
+            stopping_criteria (Optional[StoppingCriteriaList]): Extra conditions that
+                end generation early
+            
+        Returns:
+            List[str]: One summary per chunk
+        """
+        # Pad token ID chunks to the longest in the batch
+        inputs = self.tokenizer.pad(
+            {"input_ids": batch},
+            padding=True,
+            pad_to_multiple_of=self._pad_multiple,
+            return_tensors="pt"
+        )
+        inputs = inputs.to(self.device)
+
+        # Generate summaries for the whole batch in one call
+        with torch.no_grad(), self._autocast():
+            outputs = self.model.generate(
+                **inputs,
+                max_length=config.model.max_length,
+                min_length=config.model.min_length,
+                num_beams=config.model.num_beams,
+                do_sample=config.model.do_sample,
+                use_cache=config.model.use_cache,
+                no_repeat_ngram_size=config.model.no_repeat_ngram_size,
+                length_penalty=config.model.length_penalty,
+                early_stopping=config.model.num_beams > 1,
+                # A compiled forward pass needs fixed cache shapes to avoid recompiling
+                cache_implementation="static" if self._pad_multiple else None,
+                streamer=streamer,
+                stopping_criteria=stopping_criteria
+            )
+
+        return self.tokenizer.batch_decode(outputs, skip_special_tokens=True)
+
+    def _generate_streamed(
+        self,
+        chunk: List[int],
+        streamer: TextIteratorStreamer,
+        stop: threading.Event,
+        errors: list
+    ):
+        """Generate one chunk into a streamer until done or stopped, recording any error and always ending the stream."""
+        try:
+            self._generate_batch(
+                [chunk],
+                streamer=streamer,
+                stopping_criteria=StoppingCriteriaList([_StopOnEvent(stop)])
+            )
+        except Exception as e:
+            errors.append(e)
+            streamer.end()
+
+    def _join_summaries(self, batch_summaries: List[List[str]], order: List[int]) -> str:
+        """
+        Combine per-batch chunk summaries into one summary.
+        
+        Args:
+            batch_summaries (List[List[str]]): Summaries of each mini-batch, in batch order
+            order (List[int]): Original chunk index of each chunk, in batch order
+            
+        Returns:
+            str: Chunk summaries joined in original chunk order
+        """
+        summaries = self._restore_order(
+            [summary for batch in batch_summaries for summary in batch],
+            order
+        )
+        return " ".join(summaries)
+
+    def _summarize_batches(self, batches: List[List[List[int]]], order: List[int]) -> str:
+        """
+        Generate and combine summaries for mini-batches from _batch_chunks.
+        
+        Args:
+            batches (List[List[List[int]]]): Mini-batches of token ID chunks
+            order (List[int]): Original chunk index of each chunk, in batch order
+            
+        Returns:
+            str: Chunk summaries joined in original chunk order
+        """
+        return self._join_summaries([self._generate_batch(batch) for batch in batches], order)
+
     def generate_summary(self, reviews: List[str]) -> str:
         """
         Generate summary from reviews using T5 model.
@@ -106,37 +349,82 @@ class ReviewSummarizer:
             str: Generated summary
         """
         try:
-            input_text = self._prepare_input_text(reviews)
-            chunks = self._chunk_text(input_text, config.model.max_length)
-            summaries = []
-            
-            for chunk in chunks:
-                # Tokenize input
-                inputs = self.tokenizer(
-                    chunk,
-                    max_length=config.model.max_length,
-                    truncation=True,
-                    padding=True,
-                    return_tensors="pt"
-                )
-                inputs = inputs.to(self.device)
-                
-                # Generate summary
-                with torch.no_grad():
-                    outputs = self.model.generate(
-                        inputs["input_ids"],
-                        max_length=config.model.max_length,
-                        min_length=config.model.min_length,
-                        num_beams=config.model.num_beams,
-                        early_stopping=True
-                    )
-                
-                # Decode summary
-                summary = self.tokenizer.decode(outputs[0], skip_special_tokens=True)
-                summaries.append(summary)
-            
-            # Combine chunk summaries
-            final_summary = " ".join(summaries)
+            batches, order = self._batch_chunks(reviews)
+            final_summary = self._summarize_batches(batches, order)
+            app_logger.info("Successfully generated summary")
+            
+            return final_summary
+            
+        except Exception as e:
+            app_logger.error(f"Error generating summary: {str(e)}")
+            raise ModelError("Failed to generate summary", error=e)
+
+    def stream_summary(self, reviews: List[str]) -> Iterator[str]:
+        """
+        Generate summary from reviews, yielding text as it is decoded.
+        
+        Only single-chunk input with greedy decoding is streamed token by token.
+        Longer input is summarized in length-sorted mini-batches like
+        generate_summary and yielded whole, trading incremental output for
+        batched throughput.
+        
+        Args:
+            reviews (List[str]): List of preprocessed reviews
+            
+        Yields:
+            str: Successive pieces of the generated summary
+        """
+        try:
+            batches, order = self._batch_chunks(reviews)
+            
+            # Beam search does not support streamers
+            if len(order) > 1 or config.model.num_beams > 1:
+                yield self._summarize_batches(batches, order)
+                app_logger.info("Successfully generated summary")
+                return
+            
+            streamer = TextIteratorStreamer(self.tokenizer, skip_prompt=True, skip_special_tokens=True)
+            stop = threading.Event()
+            errors = []
+            thread = threading.Thread(
+                target=self._generate_streamed,
+                args=(batches[0][0], streamer, stop, errors),
+                daemon=True
+            )
+            thread.start()
+            try:
+                yield from streamer
+            finally:
+                # Stop generation if the consumer closed the generator early, and
+                # never leave the worker thread running behind the caller
+                stop.set()
+                thread.join()
+            if errors:
+                raise errors[0]
+            
+            app_logger.info("Successfully generated summary")
+            
+        except Exception as e:
+            app_logger.error(f"Error generating summary: {str(e)}")
+            raise ModelError("Failed to generate summary", error=e)
+
+    async def agenerate_summary(self, reviews: List[str]) -> str:
+        """
+        Generate summary with mini-batches running concurrently in worker threads.
+        
+        Args:
+            reviews (List[str]): List of preprocessed reviews
+            
+        Returns:
+            str: Generated summary
+        """
+        try:
+            batches, order = self._batch_chunks(reviews)
+            # gather preserves batch order
+            results = await asyncio.gather(
+                *(asyncio.to_thread(self._generate_batch, batch) for batch in batches)
+            )
+            final_summary = self._join_summaries(results, order)
             app_logger.info("Successfully generated summary")
             
             return final_summary
@@ -157,28 +445,29 @@ class ReviewSummarizer:
             str: Personalized summary
         """
         try:
-            # Split summary into sentences
-            sentences = summary.split('. ')
-            
-            # Score each sentence based on aspects
-            sentence_scores = []
-            for sentence in sentences:
-                score = 0
-                for aspect, weight in user_preferences.items():
-                    keywords = config.aspects.aspect_keywords[aspect]
-                    # Calculate aspect relevance
-                    relevance = sum(1 for keyword in keywords if keyword in sentence.lower())
-                    score += relevance * weight
-                sentence_scores.append(score)
-            
-            # Sort sentences by relevance score
-            sorted_pairs = sorted(zip(sentences, sentence_scores), key=lambda x: x[1], reverse=True)
+            # Split summary into sentences, keeping their punctuation
+            sentences = [
+                sentence if sentence.endswith(('.', '!', '?')) else sentence + '.'
+                for sentence in (part.strip() for part in _SENTENCE_RE.split(summary))
+                if sentence
+            ]
+            
+            # Count aspect keyword matches per sentence
+            aspects = list(self._aspect_patterns)
+            counts = np.zeros((len(sentences), len(aspects)), dtype=np.int32)
+            for i, sentence in enumerate(sentences):
+                sentence_lower = sentence.lower()
+                for j, aspect in enumerate(aspects):
+                    counts[i, j] = len(self._aspect_patterns[aspect].findall(sentence_lower))
+            
+            # Score each sentence based on aspects in a single matrix product
+            prefs = np.array([user_preferences.get(aspect, 0.0) for aspect in aspects], dtype=np.float32)
+            scores = counts @ prefs
             
             # Reconstruct summary with most relevant sentences first
-            personalized_summary = '. '.join(sentence for sentence, _ in sorted_pairs)
-            if not personalized_summary.endswith('.'):
-                personalized_summary += '.'
-                
+            order = np.argsort(-scores, kind="stable")
+            personalized_summary = ' '.join(sentences[i] for i in order)
+            
             app_logger.info("Successfully personalized summary")
             return personalized_summary
             
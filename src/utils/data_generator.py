@@ -1,169 +1,394 @@
 import random
+import string
+from types import MappingProxyType
+import numpy as np
 import pandas as pd
-from typing import List, Dict
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Iterator, List, Mapping, Optional, Tuple
 import os
 
+# A template pre-split into (literal text, placeholder key or None) pairs
+Segments = Tuple[Tuple[str, Optional[str]], ...]
+
+def _template_segments(template: str, data: Mapping[str, Tuple[str, ...]]) -> Segments:
+    """Split a template into literal/placeholder segments, keeping unknown placeholders as text."""
+    segments = []
+    literal = ''
+    for text, key, _, _ in string.Formatter().parse(template):
+        literal += text
+        if key is None:
+            continue
+        if key in data:
+            segments.append((literal, key))
+            literal = ''
+        else:
+            literal += '{' + key + '}'
+    if literal:
+        segments.append((literal, None))
+    return tuple(segments)
+
+# Templates for different aspects, shared read-only by every generator
+_PRICE_TEMPLATES = (
+    "The price is {price_adj}, but {value_prop}.",
+    "At {price_amount}, this product is {price_value}.",
+    "{price_value} considering the features you get.",
+    "The price point is {price_adj} for what you get.",
+    "It's {price_adj} compared to similar products."
+)
+
+_DURABILITY_TEMPLATES = (
+    "The build quality is {durability_adj}. {durability_detail}",
+    "{durability_time} of use and {durability_condition}.",
+    "In terms of durability, {durability_opinion}.",
+    "{durability_event} and {durability_result}.",
+    "The material quality is {durability_adj}."
+)
+
+_EASE_OF_USE_TEMPLATES = (
+    "The interface is {usability_adj}. {usage_detail}",
+    "Setting it up was {setup_exp}. {setup_detail}",
+    "{user_type} would find it {usability_adj} to use.",
+    "The learning curve is {learning_curve}. {learning_detail}",
+    "Navigation is {navigation_exp}."
+)
+
+_QUALITY_TEMPLATES = (
+    "The overall quality is {quality_adj}. {quality_detail}",
+    "Quality-wise, {quality_opinion}.",
+    "The {component} quality is {quality_adj}.",
+    "{quality_time} and {quality_condition}.",
+    "For the quality you get, {quality_value}."
+)
+
+_PERFORMANCE_TEMPLATES = (
+    "Performance is {performance_adj}. {performance_detail}",
+    "It handles {task} {performance_adv}.",
+    "In terms of speed, {speed_opinion}.",
+    "{performance_scenario} with {performance_result}.",
+    "The {performance_aspect} is {performance_adj}."
+)
+
+# Adjectives and phrases for each aspect
+_PRICE_DATA = MappingProxyType({
+    'price_adj': ('expensive', 'reasonable', 'premium', 'budget-friendly', 'overpriced', 'affordable', 'steep', 'competitive'),
+    'price_amount': ('$999', '$799', '$1299', '$599', '$1499', '$899'),
+    'price_value': ('worth every penny', 'a bit overpriced', 'great value for money', 'reasonably priced', 'on the expensive side'),
+    'value_prop': ('the quality justifies it', 'you get what you pay for', 'could be more competitive', 'it offers good value', 'the features make up for it')
+})
+
+_DURABILITY_DATA = MappingProxyType({
+    'durability_adj': ('excellent', 'solid', 'questionable', 'impressive', 'poor', 'outstanding'),
+    'durability_time': ('After six months', 'Two years', 'Three months', 'One year', 'Just a few weeks'),
+    'durability_condition': ('still looks brand new', 'showing signs of wear', 'working perfectly', 'no issues at all', 'needs replacement'),
+    'durability_opinion': ('it feels very sturdy', 'it seems fragile', "it's built to last", 'durability is concerning', "it's rock solid"),
+    'durability_event': ('Dropped it several times', 'Used it daily', 'Traveled with it', 'Exposed to elements'),
+    'durability_result': ('no scratches at all', 'minor wear visible', 'still perfect', 'some damage occurred', 'held up well')
+})
+
+_EASE_OF_USE_DATA = MappingProxyType({
+    'usability_adj': ('intuitive', 'straightforward', 'complicated', 'user-friendly', 'confusing'),
+    'usage_detail': ('Everything is where you expect it', 'Takes time to get used to', 'Very well designed', 'Could be more intuitive'),
+    'setup_exp': ('a breeze', 'straightforward', 'time-consuming', 'simple', 'complicated'),
+    'setup_detail': ('No manual needed', 'Required some help', 'Instructions were clear', 'Could be simpler'),
+    'user_type': ('Beginners', 'Tech-savvy users', 'Everyone', 'Most people', 'Experts'),
+    'learning_curve': ('gentle', 'steep', 'moderate', 'minimal', 'significant'),
+    'learning_detail': ('You\'ll get the hang of it quickly', 'Takes time to master', 'Pretty straightforward to learn'),
+    'navigation_exp': ('smooth and intuitive', 'a bit confusing', 'well-designed', 'could be better', 'excellent')
+})
+
+_QUALITY_DATA = MappingProxyType({
+    'quality_adj': ('exceptional', 'superior', 'average', 'disappointing', 'outstanding'),
+    'quality_detail': ('Attention to detail is evident', 'Some flaws are visible', 'Meets expectations', 'Exceeds expectations'),
+    'quality_opinion': ('it exceeds expectations', 'there\'s room for improvement', 'it\'s top-notch', 'it\'s satisfactory'),
+    'component': ('build', 'material', 'finish', 'design', 'craftsmanship'),
+    'quality_time': ('After extensive use', 'From day one', 'Over time', 'With regular use'),
+    'quality_condition': ('quality remains consistent', 'shows no degradation', 'maintains its premium feel', 'quality is evident'),
+    'quality_value': ('it\'s a premium product', 'it meets expectations', 'it\'s worth the investment', 'it\'s satisfactory')
+})
+
+_PERFORMANCE_DATA = MappingProxyType({
+    'performance_adj': ('excellent', 'impressive', 'inconsistent', 'stellar', 'mediocre'),
+    'performance_detail': ('No lag or slowdown', 'Some occasional hiccups', 'Runs smoothly', 'Could be faster'),
+    'task': ('heavy workloads', 'multiple tasks', 'intensive applications', 'basic operations', 'demanding software'),
+    'performance_adv': ('effortlessly', 'with some struggle', 'smoothly', 'adequately', 'impressively'),
+    'speed_opinion': ('it\'s lightning fast', 'it could be faster', 'it\'s consistently quick', 'it\'s satisfactory'),
+    'performance_scenario': ('Under heavy load', 'During normal use', 'In demanding situations', 'For everyday tasks'),
+    'performance_result': ('excellent results', 'some slowdown', 'consistent performance', 'impressive speed'),
+    'performance_aspect': ('response time', 'processing speed', 'overall performance', 'system efficiency')
+})
+
+# Dispatch table from aspect name to its templates and placeholder values
+_ASPECT_TABLE = MappingProxyType({
+    'price': (_PRICE_TEMPLATES, _PRICE_DATA),
+    'durability': (_DURABILITY_TEMPLATES, _DURABILITY_DATA),
+    'ease_of_use': (_EASE_OF_USE_TEMPLATES, _EASE_OF_USE_DATA),
+    'quality': (_QUALITY_TEMPLATES, _QUALITY_DATA),
+    'performance': (_PERFORMANCE_TEMPLATES, _PERFORMANCE_DATA)
+})
+
+# Words used to derive a rating from review sentiment
+_POSITIVE_WORDS = ('excellent', 'impressive', 'worth', 'great', 'perfect', 'outstanding')
+_NEGATIVE_WORDS = ('poor', 'disappointing', 'overpriced', 'complicated', 'confusing')
+_WORD_SENTIMENT = MappingProxyType({
+    **{word: 1 for word in _POSITIVE_WORDS},
+    **{word: -1 for word in _NEGATIVE_WORDS}
+})
+
+# Inclusive rating range for positive (1), negative (-1) and neutral (0) reviews
+_RATING_RANGES = MappingProxyType({1: (4, 5), -1: (1, 3), 0: (3, 4)})
+
+# Sentiment words contained in each placeholder value. Template text carries
+# no sentiment, so a review's sentiment follows from the values drawn for it
+# and the finished text never needs scanning.
+_VALUE_SENTIMENT_WORDS = MappingProxyType({
+    value: frozenset(word for word in _WORD_SENTIMENT if word in value.lower())
+    for _, data in _ASPECT_TABLE.values()
+    for values in data.values()
+    for value in values
+    if any(word in value.lower() for word in _WORD_SENTIMENT)
+})
+
+# Templates of each aspect parsed once into segments, alongside the aspect's values
+_ASPECT_SEGMENTS = MappingProxyType({
+    aspect: (tuple(_template_segments(template, data) for template in templates), data)
+    for aspect, (templates, data) in _ASPECT_TABLE.items()
+})
+
 class ReviewGenerator:
-    def __init__(self):
-        # Templates for different aspects
-        self.price_templates = [
-            "The price is {price_adj}, but {value_prop}.",
-            "At {price_amount}, this product is {price_value}.",
-            "{price_value} considering the features you get.",
-            "The price point is {price_adj} for what you get.",
-            "It's {price_adj} compared to similar products."
-        ]
-        
-        self.durability_templates = [
-            "The build quality is {durability_adj}. {durability_detail}",
-            "{durability_time} of use and {durability_condition}.",
-            "In terms of durability, {durability_opinion}.",
-            "{durability_event} and {durability_result}.",
-            "The material quality is {durability_adj}."
-        ]
-        
-        self.ease_of_use_templates = [
-            "The interface is {usability_adj}. {usage_detail}",
-            "Setting it up was {setup_exp}. {setup_detail}",
-            "{user_type} would find it {usability_adj} to use.",
-            "The learning curve is {learning_curve}. {learning_detail}",
-            "Navigation is {navigation_exp}."
-        ]
-        
-        self.quality_templates = [
-            "The overall quality is {quality_adj}. {quality_detail}",
-            "Quality-wise, {quality_opinion}.",
-            "The {component} quality is {quality_adj}.",
-            "{quality_time} and {quality_condition}.",
-            "For the quality you get, {quality_value}."
-        ]
-        
-        self.performance_templates = [
-            "Performance is {performance_adj}. {performance_detail}",
-            "It handles {task} {performance_adv}.",
-            "In terms of speed, {speed_opinion}.",
-            "{performance_scenario} with {performance_result}.",
-            "The {performance_aspect} is {performance_adj}."
-        ]
-
-        # Adjectives and phrases for each aspect
-        self.price_data = {
-            'price_adj': ['expensive', 'reasonable', 'premium', 'budget-friendly', 'overpriced', 'affordable', 'steep', 'competitive'],
-            'price_amount': ['$999', '$799', '$1299', '$599', '$1499', '$899'],
-            'price_value': ['worth every penny', 'a bit overpriced', 'great value for money', 'reasonably priced', 'on the expensive side'],
-            'value_prop': ['the quality justifies it', 'you get what you pay for', 'could be more competitive', 'it offers good value', 'the features make up for it']
-        }
-        
-        self.durability_data = {
-            'durability_adj': ['excellent', 'solid', 'questionable', 'impressive', 'poor', 'outstanding'],
-            'durability_time': ['After six months', 'Two years', 'Three months', 'One year', 'Just a few weeks'],
-            'durability_condition': ['still looks brand new', 'showing signs of wear', 'working perfectly', 'no issues at all', 'needs replacement'],
-            'durability_opinion': ['it feels very sturdy', 'it seems fragile', "it's built to last", 'durability is concerning', "it's rock solid"],
-            'durability_event': ['Dropped it several times', 'Used it daily', 'Traveled with it', 'Exposed to elements'],
-            'durability_result': ['no scratches at all', 'minor wear visible', 'still perfect', 'some damage occurred', 'held up well']
-        }
-        
-        self.ease_of_use_data = {
-            'usability_adj': ['intuitive', 'straightforward', 'complicated', 'user-friendly', 'confusing'],
-            'usage_detail': ['Everything is where you expect it', 'Takes time to get used to', 'Very well designed', 'Could be more intuitive'],
-            'setup_exp': ['a breeze', 'straightforward', 'time-consuming', 'simple', 'complicated'],
-            'setup_detail': ['No manual needed', 'Required some help', 'Instructions were clear', 'Could be simpler'],
-            'user_type': ['Beginners', 'Tech-savvy users', 'Everyone', 'Most people', 'Experts'],
-            'learning_curve': ['gentle', 'steep', 'moderate', 'minimal', 'significant'],
-            'learning_detail': ['You\'ll get the hang of it quickly', 'Takes time to master', 'Pretty straightforward to learn'],
-            'navigation_exp': ['smooth and intuitive', 'a bit confusing', 'well-designed', 'could be better', 'excellent']
-        }
-        
-        self.quality_data = {
-            'quality_adj': ['exceptional', 'superior', 'average', 'disappointing', 'outstanding'],
-            'quality_detail': ['Attention to detail is evident', 'Some flaws are visible', 'Meets expectations', 'Exceeds expectations'],
-            'quality_opinion': ['it exceeds expectations', 'there\'s room for improvement', 'it\'s top-notch', 'it\'s satisfactory'],
-            'component': ['build', 'material', 'finish', 'design', 'craftsmanship'],
-            'quality_time': ['After extensive use', 'From day one', 'Over time', 'With regular use'],
-            'quality_condition': ['quality remains consistent', 'shows no degradation', 'maintains its premium feel', 'quality is evident'],
-            'quality_value': ['it\'s a premium product', 'it meets expectations', 'it\'s worth the investment', 'it\'s satisfactory']
-        }
-        
-        self.performance_data = {
-            'performance_adj': ['excellent', 'impressive', 'inconsistent', 'stellar', 'mediocre'],
-            'performance_detail': ['No lag or slowdown', 'Some occasional hiccups', 'Runs smoothly', 'Could be faster'],
-            'task': ['heavy workloads', 'multiple tasks', 'intensive applications', 'basic operations', 'demanding software'],
-            'performance_adv': ['effortlessly', 'with some struggle', 'smoothly', 'adequately', 'impressively'],
-            'speed_opinion': ['it\'s lightning fast', 'it could be faster', 'it\'s consistently quick', 'it\'s satisfactory'],
-            'performance_scenario': ['Under heavy load', 'During normal use', 'In demanding situations', 'For everyday tasks'],
-            'performance_result': ['excellent results', 'some slowdown', 'consistent performance', 'impressive speed'],
-            'performance_aspect': ['response time', 'processing speed', 'overall performance', 'system efficiency']
-        }
+    def __init__(self, seed: Optional[int] = None):
+        # Private random source so generators can be seeded independently
+        self._rand = random.Random(seed)
+
+        # Bind the shared module-level tables; nothing is rebuilt per instance
+        self.price_templates = _PRICE_TEMPLATES
+        self.durability_templates = _DURABILITY_TEMPLATES
+        self.ease_of_use_templates = _EASE_OF_USE_TEMPLATES
+        self.quality_templates = _QUALITY_TEMPLATES
+        self.performance_templates = _PERFORMANCE_TEMPLATES
+        self.price_data = _PRICE_DATA
+        self.durability_data = _DURABILITY_DATA
+        self.ease_of_use_data = _EASE_OF_USE_DATA
+        self.quality_data = _QUALITY_DATA
+        self.performance_data = _PERFORMANCE_DATA
+        self.positive_words = _POSITIVE_WORDS
+        self.negative_words = _NEGATIVE_WORDS
+        self._aspect_table = _ASPECT_TABLE
+        self._word_sentiment = _WORD_SENTIMENT
+        self._rating_ranges = _RATING_RANGES
+        self._value_sentiment_words = _VALUE_SENTIMENT_WORDS
+        self._aspect_segments = _ASPECT_SEGMENTS
 
-    def _format_template(self, template: str, data: Dict[str, List[str]]) -> str:
-        """Format a template with random selections from data."""
-        result = template
-        for key, values in data.items():
-            if '{' + key + '}' in template:
-                result = result.replace('{' + key + '}', random.choice(values))
-        return result
+    def _render_segments(self, segments: Segments, data: Mapping[str, Tuple[str, ...]], sentiment_words: set) -> str:
+        """Render template segments with random selections from data, collecting their sentiment words."""
+        choice = self._rand.choice
+        value_words = self._value_sentiment_words
+        parts = []
+        for literal, key in segments:
+            if key:
+                value = choice(data[key])
+                sentiment_words.update(value_words.get(value, ()))
+                literal += value
+            parts.append(literal)
+        return ''.join(parts)
 
     def generate_review(self) -> tuple:
         """Generate a single review with rating."""
-        aspects = ['price', 'durability', 'ease_of_use', 'quality', 'performance']
+        # Bind per-aspect lookups to locals once rather than on every aspect
+        table = self._aspect_segments
+        render = self._render_segments
+        choice, randint = self._rand.choice, self._rand.randint
         
         # Select 2-4 aspects to focus on
-        selected_aspects = random.sample(aspects, random.randint(2, 4))
+        selected_aspects = self._rand.sample(tuple(table), randint(2, 4))
         review_parts = []
+        sentiment_words = set()
         
         for aspect in selected_aspects:
-            if aspect == 'price':
-                review_parts.append(self._format_template(random.choice(self.price_templates), self.price_data))
-            elif aspect == 'durability':
-                review_parts.append(self._format_template(random.choice(self.durability_templates), self.durability_data))
-            elif aspect == 'ease_of_use':
-                review_parts.append(self._format_template(random.choice(self.ease_of_use_templates), self.ease_of_use_data))
-            elif aspect == 'quality':
-                review_parts.append(self._format_template(random.choice(self.quality_templates), self.quality_data))
-            elif aspect == 'performance':
-                review_parts.append(self._format_template(random.choice(self.performance_templates), self.performance_data))
+            templates, data = table[aspect]
+            review_parts.append(render(choice(templates), data, sentiment_words))
         
         # Combine parts into a full review
         review = ' '.join(review_parts)
         
-        # Generate rating based on sentiment words in the review
-        positive_words = ['excellent', 'impressive', 'worth', 'great', 'perfect', 'outstanding']
-        negative_words = ['poor', 'disappointing', 'overpriced', 'complicated', 'confusing']
-        
-        review_lower = review.lower()
-        positive_count = sum(1 for word in positive_words if word in review_lower)
-        negative_count = sum(1 for word in negative_words if word in review_lower)
-        
-        # Calculate rating based on sentiment
-        if positive_count > negative_count:
-            rating = random.randint(4, 5)
-        elif positive_count < negative_count:
-            rating = random.randint(1, 3)
-        else:
-            rating = random.randint(3, 4)
+        # Calculate rating based on the sentiment of the drawn values
+        rating = randint(*self._rating_ranges[self._sentiment_sign(sentiment_words)])
         
         return review, rating
 
-    def generate_dataset(self, num_reviews: int = 200) -> pd.DataFrame:
-        """Generate a dataset with specified number of reviews."""
-        reviews = []
-        ratings = []
+    def _sentiment_sign(self, sentiment_words: set) -> int:
+        """Return 1, -1 or 0 as distinct positive sentiment words outnumber, trail or match negative ones."""
+        word_sentiment = self._word_sentiment
+        score = sum(word_sentiment[word] for word in sentiment_words)
+        return (score > 0) - (score < 0)
+
+    def generate_dataset(self, num_reviews: int = 200, seed: Optional[int] = None) -> pd.DataFrame:
+        """Generate a dataset with specified number of reviews as a pandas DataFrame."""
+        return self.generate_table(num_reviews, seed=seed).to_pandas()
+    
+    def generate_table(self, num_reviews: int = 200, seed: Optional[int] = None) -> pa.Table:
+        """Generate a dataset as an Arrow table, drawing all random choices in bulk."""
+        # Without an explicit seed, follow the generator's own seeded random source
+        rng = np.random.default_rng(self._rand.getrandbits(64) if seed is None else seed)
+        sources = self._aspect_segments
+        aspects = list(sources)
+        value_words = self._value_sentiment_words
+        
+        # Select 2-4 aspects per review in random order (emulates random.sample)
+        n_aspects = rng.integers(2, 5, size=num_reviews).tolist()
+        aspect_order = np.argsort(rng.random((num_reviews, len(aspects))), axis=1).tolist()
+        
+        # Pre-draw template and placeholder value indices for every aspect.
+        # Draws are converted to lists so the per-review loop indexes plain
+        # Python ints instead of boxing a NumPy scalar on every lookup.
+        template_idx = {
+            aspect: rng.integers(0, len(templates), size=num_reviews).tolist()
+            for aspect, (templates, _) in sources.items()
+        }
+        value_idx = {
+            aspect: {key: rng.integers(0, len(values), size=num_reviews).tolist() for key, values in data.items()}
+            for aspect, (_, data) in sources.items()
+        }
+        
+        # Pre-draw a rating for each sentiment outcome
+        rating_draws = {
+            sign: rng.integers(low, high + 1, size=num_reviews).tolist()
+            for sign, (low, high) in self._rating_ranges.items()
+        }
+        
+        # Preallocate outputs; int8 ratings are handed to Arrow without a copy
+        reviews = [None] * num_reviews
+        ratings = np.empty(num_reviews, dtype=np.int8)
         
-        for _ in range(num_reviews):
-            review, rating = self.generate_review()
-            reviews.append(review)
-            ratings.append(rating)
+        for i in range(num_reviews):
+            parts = []
+            sentiment_words = set()
+            for aspect in (aspects[j] for j in aspect_order[i][:n_aspects[i]]):
+                templates, data = sources[aspect]
+                indices = value_idx[aspect]
+                for literal, key in templates[template_idx[aspect][i]]:
+                    if key:
+                        value = data[key][indices[key][i]]
+                        sentiment_words.update(value_words.get(value, ()))
+                        literal += value
+                    parts.append(literal)
+                parts.append(' ')
+            
+            # Drop the separator after the last aspect
+            parts.pop()
+            review = ''.join(parts)
+            rating = rating_draws[self._sentiment_sign(sentiment_words)][i]
+            
+            reviews[i] = review
+            ratings[i] = rating
         
-        return pd.DataFrame({
-            'review_text': reviews,
-            'rating': ratings
+        return pa.table({
+            'review_text': pa.array(reviews, type=pa.large_string()),
+            'rating': pa.array(ratings)
         })
 
-def generate_sample_data(output_path: str, num_reviews: int = 200):
-    """Generate sample review data and save to CSV."""
-    generator = ReviewGenerator()
-    df = generator.generate_dataset(num_reviews)
-    df.to_csv(output_path, index=False)
+# Below this size process startup costs more than parallel generation saves
+_PARALLEL_MIN_REVIEWS = 2000
+
+def _generate_chunk(num_reviews: int, seed: int) -> pa.Table:
+    """Generate one chunk of a dataset in a worker process."""
+    return ReviewGenerator(seed).generate_table(num_reviews, seed=seed)
+
+# Rows generated per chunk; also the row group size when streaming to disk
+_WRITE_CHUNK_SIZE = 10_000
+
+# Chunks queued or finished but not yet consumed, per worker process
+_MAX_PENDING_PER_JOB = 2
+
+# Fixed schema of generated datasets
+_REVIEW_SCHEMA = pa.schema([('review_text', pa.large_string()), ('rating', pa.int8())])
+
+def _chunk_sizes(num_reviews: int, n_jobs: int, chunk_size: int) -> List[int]:
+    """Split a dataset into chunk sizes, using smaller chunks so mid-sized runs still use every worker."""
+    if num_reviews >= _PARALLEL_MIN_REVIEWS and n_jobs > 1:
+        chunk_size = min(chunk_size, -(-num_reviews // n_jobs))
+    sizes = [chunk_size] * (num_reviews // chunk_size)
+    if num_reviews % chunk_size:
+        sizes.append(num_reviews % chunk_size)
+    return sizes
+
+def iter_table_chunks(
+    num_reviews: int,
+    seed: Optional[int] = None,
+    n_jobs: Optional[int] = None,
+    chunk_size: int = _WRITE_CHUNK_SIZE
+) -> Iterator[pa.Table]:
+    """Yield a dataset as Arrow tables of at most chunk_size rows, generated across worker processes."""
+    n_jobs = n_jobs or os.cpu_count() or 1
+    sizes = _chunk_sizes(num_reviews, n_jobs, chunk_size)
+    
+    # Give each chunk an independent seed derived from the dataset seed
+    seeds = [int(child.generate_state(1)[0]) for child in np.random.SeedSequence(seed).spawn(len(sizes))]
+    
+    if len(sizes) <= 1 or n_jobs == 1:
+        yield from map(_generate_chunk, sizes, seeds)
+        return
+    
+    # Keep a bounded number of chunks in flight and yield them in order, so a
+    # slow consumer holds at most _MAX_PENDING_PER_JOB chunks per worker
+    workers = min(n_jobs, len(sizes))
+    jobs = zip(sizes, seeds)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque(executor.submit(_generate_chunk, size, chunk_seed)
+                        for size, chunk_seed in islice(jobs, _MAX_PENDING_PER_JOB * workers))
+        try:
+            while pending:
+                table = pending.popleft().result()
+                for size, chunk_seed in islice(jobs, 1):
+                    pending.append(executor.submit(_generate_chunk, size, chunk_seed))
+                yield table
+        finally:
+            # Don't generate chunks nobody will read if the consumer stops early
+            for future in pending:
+                future.cancel()
+
+def generate_table_parallel(
+    num_reviews: int,
+    seed: Optional[int] = None,
+    n_jobs: Optional[int] = None
+) -> pa.Table:
+    """Generate an Arrow table across worker processes, using one process for small runs."""
+    chunks = list(iter_table_chunks(num_reviews, seed=seed, n_jobs=n_jobs))
+    return pa.concat_tables(chunks) if chunks else _REVIEW_SCHEMA.empty_table()
+
+def generate_dataset_parallel(
+    num_reviews: int,
+    seed: Optional[int] = None,
+    n_jobs: Optional[int] = None
+) -> pd.DataFrame:
+    """Generate a dataset across worker processes as a pandas DataFrame."""
+    return generate_table_parallel(num_reviews, seed=seed, n_jobs=n_jobs).to_pandas()
+
+def generate_sample_data(
+    output_path: str,
+    num_reviews: int = 200,
+    seed: Optional[int] = None,
+    n_jobs: Optional[int] = None
+):
+    """Generate sample review data and save as CSV, Parquet or Feather based on the file extension."""
+    # Write straight from Arrow; pandas is never involved on this path
+    extension = os.path.splitext(output_path)[1].lower()
+    if extension == '.parquet':
+        writer = pq.ParquetWriter(output_path, _REVIEW_SCHEMA, compression='zstd', compression_level=3)
+    elif extension == '.feather':
+        # Feather V2 is the Arrow IPC file format, compressed like write_feather's default
+        writer = pa.ipc.new_file(output_path, _REVIEW_SCHEMA, options=pa.ipc.IpcWriteOptions(compression='lz4'))
+    else:
+        writer = pa_csv.CSVWriter(output_path, _REVIEW_SCHEMA)
+    
+    # Stream chunk by chunk so memory stays flat for large datasets
+    with writer:
+        for table in iter_table_chunks(num_reviews, seed=seed, n_jobs=n_jobs):
+            writer.write_table(table)
     print(f"Generated {num_reviews} reviews and saved to {output_path}")
 
 if __name__ == "__main__":
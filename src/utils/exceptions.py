@@ -1,22 +1,32 @@
 class ReviewSummarizerException(Exception):
     """Base exception class for the Review Summarizer project."""
+    __slots__ = ('error',)
+
     def __init__(self, message: str = None, error: Exception = None):
-        self.message = message
+        super().__init__(message)
         self.error = error
-        super().__init__(self.message)
+
+    @property
+    def message(self) -> str:
+        """The message passed to the exception, stored once in args."""
+        return self.args[0] if self.args else None
+
+    def __reduce__(self):
+        # Slots aren't pickled by BaseException, so keep the wrapped error explicitly
+        return type(self), (self.message, self.error)
 
 class DataProcessingError(ReviewSummarizerException):
     """Raised when there's an error processing the review data."""
-    pass
+    __slots__ = ()
 
 class ModelError(ReviewSummarizerException):
     """Raised when there's an error with the model operations."""
-    pass
+    __slots__ = ()
 
 class ConfigError(ReviewSummarizerException):
     """Raised when there's an error in configuration."""
-    pass
+    __slots__ = ()
 
 class ValidationError(ReviewSummarizerException):
     """Raised when there's an error in input validation."""
-    pass
+    __slots__ = ()
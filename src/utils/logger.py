@@ -1,38 +1,46 @@
 from loguru import logger
+import functools
 import sys
 import os
-from datetime import datetime
+import time
 
 class Logger:
     @staticmethod
     def setup_logger():
         """Set up logger configuration with rotation and formatting."""
         try:
-            # Create logs directory if it doesn't exist
-            if not os.path.exists("logs"):
-                os.makedirs("logs")
-
-            # Generate log filename with timestamp
-            log_filename = f"logs/app_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
-
             # Remove any existing logger configurations
             logger.remove()
 
-            # Add console output
+            # Add console output; records are formatted on a background thread
             logger.add(
                 sys.stdout,
                 format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
-                level="INFO"
+                level="INFO",
+                enqueue=True,
+                backtrace=False,
+                diagnose=False
             )
 
-            # Add file output with rotation
-            logger.add(
-                log_filename,
-                rotation="500 MB",  # Create new file after 500MB
-                retention="10 days",  # Keep logs for 10 days
-                format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
-                level="DEBUG"
-            )
+            # Add file output with rotation only when requested, so tests and
+            # data generation runs don't create log files
+            if os.environ.get("APP_LOG_TO_FILE"):
+                # Create logs directory if it doesn't exist
+                os.makedirs("logs", exist_ok=True)
+
+                # Generate log filename from the epoch timestamp
+                log_filename = f"logs/app_{int(time.time())}.log"
+
+                logger.add(
+                    log_filename,
+                    rotation="500 MB",  # Create new file after 500MB
+                    retention="10 days",  # Keep logs for 10 days
+                    format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
+                    level="DEBUG",
+                    enqueue=True,
+                    backtrace=False,
+                    diagnose=False
+                )
 
             logger.info("Logger initialized successfully")
             return logger
@@ -41,5 +49,15 @@ class Logger:
             print(f"Error setting up logger: {str(e)}")
             raise
 
-# Initialize logger
-app_logger = Logger.setup_logger()
+@functools.cache
+def get_logger():
+    """Set up the logger on first use and return it."""
+    return Logger.setup_logger()
+
+class _LazyLogger:
+    """Stand-in for the configured logger that defers setup until it is first used."""
+    def __getattr__(self, name):
+        return getattr(get_logger(), name)
+
+# Logger is configured lazily on the first logging call
+app_logger = _LazyLogger()
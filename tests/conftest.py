@@ -0,0 +1,6 @@
+import sys
+from pathlib import Path
+
+# Add the project root to the Python path once for the whole test session
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
@@ -0,0 +1,74 @@
+import pytest
+import pandas as pd
+import pyarrow as pa
+
+from src.utils.data_generator import (
+    ReviewGenerator,
+    generate_table_parallel,
+    generate_sample_data,
+    _WRITE_CHUNK_SIZE,
+    _ASPECT_SEGMENTS,
+    _WORD_SENTIMENT
+)
+
+def test_generate_dataset_is_deterministic():
+    first = ReviewGenerator(1).generate_dataset(500)
+    second = ReviewGenerator(1).generate_dataset(500)
+
+    pd.testing.assert_frame_equal(first, second)
+
+def test_generate_dataset_explicit_seed_overrides_instance_seed():
+    first = ReviewGenerator(1).generate_dataset(500, seed=9)
+    second = ReviewGenerator(2).generate_dataset(500, seed=9)
+
+    pd.testing.assert_frame_equal(first, second)
+
+def test_generate_dataset_shape_and_dtypes():
+    df = ReviewGenerator(2).generate_dataset(300)
+
+    assert len(df) == 300
+    assert list(df.columns) == ['review_text', 'rating']
+    assert df['rating'].dtype == 'int8'
+    assert df['rating'].between(1, 5).all()
+    assert df['review_text'].str.len().gt(0).all()
+
+def test_generate_review_rating_in_range():
+    generator = ReviewGenerator(3)
+    for _ in range(100):
+        review, rating = generator.generate_review()
+        assert review
+        assert 1 <= rating <= 5
+
+def test_template_literals_have_no_sentiment_words():
+    # Ratings only look at sentiment words in placeholder values, so template
+    # text containing one would silently go uncounted
+    for segments_list, _ in _ASPECT_SEGMENTS.values():
+        for segments in segments_list:
+            for literal, _ in segments:
+                assert not [word for word in _WORD_SENTIMENT if word in literal.lower()], literal
+
+def test_generate_table_parallel_is_reproducible():
+    first = generate_table_parallel(5000, seed=4, n_jobs=2)
+    second = generate_table_parallel(5000, seed=4, n_jobs=2)
+
+    assert first.num_rows == 5000
+    assert first.schema.field('rating').type == pa.int8()
+    assert first.equals(second)
+
+@pytest.mark.parametrize("num_reviews", [0, 200, _WRITE_CHUNK_SIZE + 1])
+def test_generate_sample_data_round_trips(tmp_path, num_reviews):
+    frames = {}
+    for extension in ('csv', 'parquet', 'feather'):
+        output_path = str(tmp_path / f"reviews.{extension}")
+        generate_sample_data(output_path, num_reviews, seed=5, n_jobs=2)
+        frames[extension] = getattr(pd, f"read_{extension}")(output_path)
+
+    for df in frames.values():
+        assert len(df) == num_reviews
+        assert list(df.columns) == ['review_text', 'rating']
+
+    # The same seed gives the same rows whatever the file format
+    csv = frames['csv']
+    for extension in ('parquet', 'feather'):
+        assert frames[extension]['review_text'].tolist() == csv['review_text'].tolist()
+        assert frames[extension]['rating'].tolist() == csv['rating'].tolist()
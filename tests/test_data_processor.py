@@ -1,22 +1,18 @@
 import pytest
 import pandas as pd
-import os
-import sys
-from pathlib import Path
-
-# Add src to Python path
-src_path = Path(__file__).parent.parent
-sys.path.append(str(src_path))
+import numpy as np
 
 from src.data.data_processor import DataProcessor
+from src.config.config import config
 from src.utils.exceptions import DataProcessingError
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def data_processor():
     return DataProcessor()
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_reviews():
+    # Built once per session; tests must copy rather than modify it
     return pd.DataFrame({
         'review_text': [
             "This product is very cheap but breaks easily.",
@@ -64,6 +60,38 @@ def test_filter_reviews_by_preference(data_processor, sample_reviews):
     # First review should contain price-related content
     assert any(word in filtered[0].lower() for word in ['cheap', 'expensive', 'price', 'cost'])
 
+def test_filter_reviews_accepts_score_dicts(data_processor, sample_reviews):
+    processed_reviews, aspect_scores = data_processor.prepare_for_summarization(sample_reviews)
+    assert aspect_scores.shape == (len(sample_reviews), 5)
+    
+    score_dicts = [data_processor.calculate_aspect_scores(text) for text in processed_reviews]
+    user_preferences = {'price': 1.0, 'quality': 0.5}
+    
+    assert data_processor.filter_reviews_by_preference(
+        processed_reviews, score_dicts, user_preferences
+    ) == data_processor.filter_reviews_by_preference(
+        processed_reviews, aspect_scores, user_preferences
+    )
+
+def test_filter_reviews_caps_at_max_reviews(data_processor, monkeypatch):
+    reviews = [f"review {i}" for i in range(10)]
+    aspect_scores = np.zeros((10, 5), dtype=np.float32)
+    aspect_scores[:, 0] = np.arange(10)
+    monkeypatch.setattr(config.data, 'max_reviews', 3)
+    
+    filtered = data_processor.filter_reviews_by_preference(reviews, aspect_scores, {'price': 1.0})
+    
+    assert filtered == ["review 9", "review 8", "review 7"]
+
+def test_prepare_for_summarization_drops_duplicates(data_processor, sample_reviews):
+    duplicated = pd.concat([sample_reviews, sample_reviews.iloc[[0]]], ignore_index=True)
+    duplicated.loc[3, 'review_text'] = duplicated.loc[3, 'review_text'].upper()
+    
+    processed_reviews, aspect_scores = data_processor.prepare_for_summarization(duplicated)
+    
+    assert len(processed_reviews) == len(sample_reviews)
+    assert aspect_scores.shape[0] == len(processed_reviews)
+
 def test_invalid_data_handling(data_processor):
     with pytest.raises(DataProcessingError):
         data_processor.preprocess_text(None)
@@ -0,0 +1,129 @@
+import asyncio
+import re
+import threading
+import time
+import pytest
+
+torch = pytest.importorskip("torch")
+
+from src.models.summarizer import ReviewSummarizer
+from src.config.config import config
+
+class _Inputs(dict):
+    """Padded model inputs; stays on the CPU."""
+    def to(self, device):
+        return self
+
+class StubTokenizer:
+    """Maps each whitespace-separated word to its own token ID."""
+    eos_token_id = 1
+
+    def __init__(self):
+        self.vocab = {}
+
+    def encode(self, text, add_special_tokens=False):
+        return [self.vocab.setdefault(word, len(self.vocab) + 2) for word in text.split()]
+
+    def pad(self, encoded, **kwargs):
+        return _Inputs(encoded)
+
+    def decode(self, ids, **kwargs):
+        return "".join(f"w{i} " for i in ids)
+
+    def batch_decode(self, outputs, **kwargs):
+        # Name each summary after the first token of its chunk
+        return [f"chunk{ids[0]}." for ids in outputs]
+
+class StubModel:
+    """Echoes inputs back, or streams steps tokens until stopped."""
+    def __init__(self, steps=3, delay=0.0):
+        self.steps = steps
+        self.delay = delay
+        self.steps_run = 0
+        self.thread = None
+
+    def generate(self, input_ids, streamer=None, stopping_criteria=None, **kwargs):
+        if streamer is None:
+            return input_ids
+
+        self.thread = threading.current_thread()
+        generated = torch.tensor([[0]])
+        # The decoder start token is the prompt the streamer skips
+        streamer.put(generated)
+        for step in range(self.steps):
+            if stopping_criteria is not None and bool(stopping_criteria(generated, None).all()):
+                break
+            streamer.put(torch.tensor([step + 2]))
+            self.steps_run += 1
+            time.sleep(self.delay)
+        streamer.end()
+        return generated
+
+@pytest.fixture
+def summarizer(monkeypatch):
+    monkeypatch.setattr(config.model, 'max_length', 4)
+    monkeypatch.setattr(config.model, 'batch_size', 2)
+    monkeypatch.setattr(config.model, 'num_beams', 1)
+
+    # Skip model loading; only the pieces the methods under test use are set
+    summarizer = ReviewSummarizer.__new__(ReviewSummarizer)
+    summarizer.device = torch.device("cpu")
+    summarizer.tokenizer = StubTokenizer()
+    summarizer.model = StubModel()
+    summarizer._pad_multiple = None
+    summarizer._fast_path_hits = 0
+    summarizer._aspect_patterns = {
+        aspect: re.compile(r"\b(?:" + "|".join(map(re.escape, keywords)) + r")\b")
+        for aspect, keywords in config.aspects.aspect_keywords.items()
+    }
+    return summarizer
+
+def test_chunk_text_adds_eos_to_every_chunk(summarizer):
+    ids = summarizer.tokenizer.encode("a b c d e f g")
+    eos = summarizer.tokenizer.eos_token_id
+
+    assert summarizer._chunk_text("a b c d e f g", 4) == [ids[0:3] + [eos], ids[3:6] + [eos], ids[6:] + [eos]]
+
+def test_chunk_text_fast_path_for_short_input(summarizer):
+    ids = summarizer.tokenizer.encode("a b")
+
+    assert summarizer._chunk_text("a b", 4) == [ids + [summarizer.tokenizer.eos_token_id]]
+    assert summarizer._fast_path_hits == 1
+
+def test_summaries_keep_chunk_order(summarizer):
+    reviews = ["a b c d e f g"]
+    chunks = summarizer._chunk_text(summarizer._prepare_input_text(reviews), config.model.max_length)
+    expected = " ".join(f"chunk{chunk[0]}." for chunk in chunks)
+
+    # The short last chunk is batched first, so order has to be restored
+    batches, _ = summarizer._batch_chunks(reviews)
+    assert batches[0][0] == chunks[-1]
+
+    assert summarizer.generate_summary(reviews) == expected
+    assert "".join(summarizer.stream_summary(reviews)) == expected
+
+def test_agenerate_summary_matches_generate_summary(summarizer):
+    reviews = ["a b c d e f g h i j", "k l m"]
+
+    assert asyncio.run(summarizer.agenerate_summary(reviews)) == summarizer.generate_summary(reviews)
+
+def test_stream_summary_streams_single_chunk(summarizer):
+    assert "".join(summarizer.stream_summary(["a"])) == "w2 w3 w4 "
+
+def test_closing_stream_stops_worker_thread(summarizer):
+    summarizer.model = StubModel(steps=1000, delay=0.001)
+    stream = summarizer.stream_summary(["a"])
+
+    assert next(stream) == "w2 "
+    stream.close()
+
+    assert not summarizer.model.thread.is_alive()
+    assert summarizer.model.steps_run < 1000
+
+def test_personalize_summary_orders_sentences_by_preference(summarizer):
+    summary = "Shipping was the fastest. It is fast. The price is cheap! Nice color"
+
+    personalized = summarizer.personalize_summary(summary, {'price': 1.0, 'performance': 0.5})
+
+    # "fastest" is not the keyword "fast"; unscored sentences keep their order
+    assert personalized == "The price is cheap! It is fast. Shipping was the fastest. Nice color."